@@ -27,14 +27,12 @@ from yamlr.ui.formatter import YamlrFormatter
 
 # Command Modules
 from yamlr.cli.commands.base import (
-    get_console, 
-    print_custom_header, 
-    print_version, 
     get_console, 
     print_custom_header, 
     print_version, 
     add_standard_flags,
-    validate_required_arg
+    validate_required_arg,
+    normalize_paths
 )
 from yamlr.cli.commands.scan import handle_scan_command
 from yamlr.cli.commands.heal import handle_heal_command
@@ -115,7 +113,7 @@ def main():
         # In a real refactor, this block handles the daily reminders logic
         
     except Exception as e:
-        logger.debug(f"Identity detection failed: {e}")
+        logger.debug("Identity detection failed: %s", e)
         invoked_as = "yamlr"
         is_pro = False
 
@@ -196,7 +194,6 @@ def main():
         logging.getLogger().setLevel(logging.ERROR)
     
     # Pre-process: Support comma-separated args
-    from yamlr.cli.commands.base import normalize_paths
     if hasattr(args, 'path') and args.path:
         args.path = normalize_paths(args.path)
 
@@ -238,11 +235,6 @@ def main():
              console.print(f"\n[bold green]USAGE:[/bold green] [bold white]{invoked_as} explain [rule_id][/bold white]")
              console.print("Shows detailed documentation, rationale, and remediation steps for a specific rule.")
              sys.exit(0)
-             
-        if args.command in ["heal", "scan"] and not args.path:
-             pass # Fallthrough to standard help
-        elif args.command not in ["catalog", "init", "explain", "version"]: 
-             pass
 
         if not is_json: print_custom_header(invoked_as, is_pro)
         
@@ -353,7 +345,7 @@ def main():
             
             if not fallback_path:
                 # If we can't find a bundled catalog, explicitly warn (but let Manager try cache)
-                logger.warning(f"Could not locate bundled catalog. Checked: {candidates}")
+                logger.warning("Could not locate bundled catalog. Checked: %s", candidates)
                 # fallback_path remains None
             
         catalog_mgr = CatalogManager()